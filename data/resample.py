@@ -0,0 +1,147 @@
+# File: data/resample.py
+
+import pandas as pd
+import logging
+from pandas.tseries.frequencies import to_offset
+
+logger = logging.getLogger(__name__)
+
+# pandas resample rules for every supported timeframe. Weekly bars start on
+# Monday to line up with the bars yfinance returns for interval='1wk'.
+TIMEFRAME_RULES = {
+    "1h": "1h",
+    "1d": "1D",
+    "1wk": "W-MON",
+}
+
+# Nominal span of each interval, used to check that a target timeframe is
+# coarser than the base series it is built from.
+INTERVAL_SPANS = {
+    "1m": pd.Timedelta(minutes=1),
+    "5m": pd.Timedelta(minutes=5),
+    "15m": pd.Timedelta(minutes=15),
+    "30m": pd.Timedelta(minutes=30),
+    "1h": pd.Timedelta(hours=1),
+    "1d": pd.Timedelta(days=1),
+    "1wk": pd.Timedelta(weeks=1),
+}
+
+OHLCV_COLS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def _check_timeframe(timeframe, base_interval):
+    if timeframe not in TIMEFRAME_RULES:
+        raise ValueError(f"[ERROR] Unsupported timeframe: {timeframe}")
+    if base_interval not in INTERVAL_SPANS:
+        raise ValueError(f"[ERROR] Unsupported base interval: {base_interval}")
+    if INTERVAL_SPANS[timeframe] < INTERVAL_SPANS[base_interval]:
+        raise ValueError(
+            f"[ERROR] Cannot build {timeframe} bars from coarser {base_interval} data"
+        )
+
+
+def _normalize_base(df: pd.DataFrame) -> pd.DataFrame:
+    # yfinance names the index 'Datetime' for intraday intervals
+    if 'Date' not in df.columns and 'Datetime' in df.columns:
+        df = df.rename(columns={'Datetime': 'Date'})
+
+    missing = set(OHLCV_COLS) - set(df.columns)
+    if missing:
+        raise ValueError(f"[ERROR] Missing required columns for resampling: {sorted(missing)}")
+
+    base = df[OHLCV_COLS].copy()
+    base["Date"] = pd.to_datetime(base["Date"])
+    return base.sort_values("Date").reset_index(drop=True)
+
+
+def resample_ohlcv(df: pd.DataFrame, timeframe: str, base_interval: str = "1d") -> pd.DataFrame:
+    """
+    Aggregate a base-interval OHLCV series into higher-timeframe bars.
+
+    Parameters:
+        df (pd.DataFrame): Base bars with 'Date', 'Open', 'High', 'Low', 'Close', 'Volume'
+        timeframe (str): Target timeframe ('1h', '1d' or '1wk')
+        base_interval (str): Interval of the input bars (e.g., '1h', '1d')
+
+    Returns:
+        pd.DataFrame: Bars labelled by their start in 'Date', plus 'PeriodEnd' holding
+        the time each bar's period closes (the start of the next period)
+    """
+    _check_timeframe(timeframe, base_interval)
+
+    rule = TIMEFRAME_RULES[timeframe]
+    bars = _normalize_base(df).groupby(
+        pd.Grouper(key="Date", freq=rule, label="left", closed="left")
+    ).agg(
+        Open=("Open", "first"),
+        High=("High", "max"),
+        Low=("Low", "min"),
+        Close=("Close", "last"),
+        Volume=("Volume", "sum"),
+    )
+
+    # Empty groups (weekends, market holidays) have no base bars behind them
+    bars = bars.dropna(subset=["Close"]).reset_index()
+    bars["PeriodEnd"] = bars["Date"] + to_offset(rule)
+    return bars[OHLCV_COLS + ["PeriodEnd"]]
+
+
+class TimeframeCache:
+    """
+    In-memory store of higher-timeframe bars built from one base-interval series.
+
+    yf.download returns the whole period on every fetch, so bars are always
+    rebuilt from the full base series and depend only on that input. The cache
+    keeps the last base series per ticker and skips resampling when an update
+    brings exactly the same rows again.
+    """
+
+    def __init__(self, timeframes, base_interval="1d"):
+        for timeframe in timeframes:
+            _check_timeframe(timeframe, base_interval)
+        self.timeframes = list(timeframes)
+        self.base_interval = base_interval
+        self._bars = {}
+        self._base = {}
+
+    def update(self, ticker, base_df):
+        """
+        Bring every cached timeframe for a ticker up to date with its base series.
+
+        Parameters:
+            ticker (str): Ticker symbol the base series belongs to
+            base_df (pd.DataFrame): Latest base-interval OHLCV data for the ticker
+
+        Returns:
+            dict: {timeframe: DataFrame of resampled bars}
+        """
+        base = _normalize_base(base_df)
+        previous = self._base.get(ticker)
+
+        if previous is not None and previous.equals(base):
+            return self.get(ticker)
+
+        for timeframe in self.timeframes:
+            self._bars[(ticker, timeframe)] = resample_ohlcv(base, timeframe, self.base_interval)
+        logger.debug(f"[DEBUG] Resampled {ticker} to {', '.join(self.timeframes)}")
+
+        self._base[ticker] = base
+        return self.get(ticker)
+
+    def get(self, ticker):
+        """Return {timeframe: bars} for every timeframe cached for a ticker."""
+        return {
+            timeframe: self._bars[(ticker, timeframe)]
+            for timeframe in self.timeframes
+            if (ticker, timeframe) in self._bars
+        }
+
+    def clear(self, ticker=None):
+        """Drop cached bars for one ticker, or for every ticker when none is given."""
+        if ticker is None:
+            self._bars.clear()
+            self._base.clear()
+            return
+        self._base.pop(ticker, None)
+        for timeframe in self.timeframes:
+            self._bars.pop((ticker, timeframe), None)
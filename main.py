@@ -3,8 +3,19 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime
 
-from strategies.strategies import generate_signals, compute_indicators
+from data.resample import resample_ohlcv
+from strategies.strategies import (
+    generate_signals,
+    compute_indicators,
+    add_timeframe_features,
+    timeframe_feature_columns,
+)
 from ml.model import run_ml_model
+from utils.charts import (
+    ChartRenderer,
+    PRICE_COLS as CHART_PRICE_COLS,
+    SIGNAL_COLS as CHART_SIGNAL_COLS,
+)
 from utils.google_sheets import (
     connect_to_gsheet,
     log_trade,
@@ -14,38 +25,83 @@ from utils.google_sheets import (
 )
 
 TICKERS = ["RELIANCE.NS", "INFY.NS", "TCS.NS"]
-PERIOD = "6mo"
+PERIOD_MONTHS = 6
+PERIOD = f"{PERIOD_MONTHS}mo"
+HISTORY_PERIOD = "2y"  # Downloaded once so weekly features are warmed up for all of PERIOD
 INTERVAL = "1d"
+TIMEFRAMES = ["1wk"]  # Higher timeframes resampled from INTERVAL bars
 SHEET_NAME = "AlgoTradingLog"
 CREDENTIALS_FILE = "credentials.json"
 
-try:
-    sheet = connect_to_gsheet(CREDENTIALS_FILE, SHEET_NAME)
-except Exception as e:
-    print(f"[ERROR] Google Sheets connection failed: {e}")
-    sys.exit(1)
 
-for ticker in TICKERS:
+def process_ticker(ticker, timeframe_cache=None):
+    """
+    Fetch one ticker and run the indicator, signal and ML steps on it.
+
+    Nothing is written to Google Sheets here, so this can run in a worker
+    process; log_result() owns every sink write. Long-lived callers pass a
+    TimeframeCache so unchanged downloads are not resampled again.
+
+    Returns:
+        dict | None: Compact result for log_result(), or None if the ticker
+        produced no data or its signals could not be generated
+    """
     print(f"\n📈 Processing {ticker}...")
 
-    data = yf.download(ticker, period=PERIOD, interval=INTERVAL, auto_adjust=True)
+    data = yf.download(ticker, period=HISTORY_PERIOD, interval=INTERVAL, auto_adjust=True)
     if data.empty:
         print(f"[ERROR] No data for {ticker}")
-        continue
+        return None
 
     data.reset_index(inplace=True)
     data.columns = [col[0] if isinstance(col, tuple) else col for col in data.columns]
 
     try:
-        signals_df = generate_signals(data)
-        signals_df.dropna(inplace=True)
+        if timeframe_cache is not None:
+            timeframe_bars = timeframe_cache.update(ticker, data)
+        else:
+            timeframe_bars = {tf: resample_ohlcv(data, tf, INTERVAL) for tf in TIMEFRAMES}
+    except Exception as e:
+        print(f"[ERROR] Resampling failed for {ticker}: {e}")
+        timeframe_bars = {}
+
+    # Higher timeframes use the full history; signals and ML stay on the last PERIOD
+    cutoff = pd.to_datetime(data["Date"]).max() - pd.DateOffset(months=PERIOD_MONTHS)
+    data = data[pd.to_datetime(data["Date"]) > cutoff].reset_index(drop=True)
+
+    try:
+        signals_df = generate_signals(data, timeframe_bars)
+        # Higher-timeframe columns stay NaN during warm-up; don't drop those rows
+        signals_df.dropna(
+            subset=[col for col in signals_df.columns if col not in timeframe_feature_columns(signals_df)],
+            inplace=True,
+        )
     except Exception as e:
         print(f"[ERROR] Signal generation failed for {ticker}: {e}")
-        continue
+        return None
+
+    result = {
+        "ticker": ticker,
+        "trade_rows": [],
+        "chart": None,
+        "predictions": None,
+        "ml_volume": None,
+        "accuracy": 0,
+        "log_summary": False,
+    }
+
+    try:
+        indicators = compute_indicators(data)
+    except Exception as e:
+        print(f"[ERROR] Failed to compute indicators for {ticker}: {e}")
+        return None
+
+    # Every ticker gets a chart, with or without BUY/SELL markers
+    result["chart"] = (indicators[CHART_PRICE_COLS], signals_df[CHART_SIGNAL_COLS])
 
     if signals_df.empty:
         print(f"⚠️ No signals generated for {ticker}")
-        continue
+        return result
 
     print(f"✅ {len(signals_df)} signals generated.")
 
@@ -65,34 +121,72 @@ for ticker in TICKERS:
             ]
         )
 
-    try:
-        log_trade(sheet, trade_rows)
-        print(f"✅ Logged {len(trade_rows)} trades for {ticker}.")
-    except Exception as e:
-        print(f"[ERROR] Logging trades for {ticker} failed: {e}")
+    result["trade_rows"] = trade_rows
 
     try:
-        data = compute_indicators(data)
+        data = indicators.copy()
+        if timeframe_bars:
+            data = add_timeframe_features(data, timeframe_bars)
         data["Signal"] = None
         data.loc[data["RSI"] < 30, "Signal"] = "BUY"
         data.loc[data["RSI"] > 70, "Signal"] = "SELL"
         data_ml = data[data["Signal"].notna()]
     except Exception as e:
         print(f"[ERROR] Failed to compute indicators for ML: {e}")
-        continue
+        return result
+
+    result["log_summary"] = True
+
+    # Only use higher-timeframe features that are warmed up for every ML row
+    mtf_features = [
+        col for col in timeframe_feature_columns(data_ml) if data_ml[col].notna().all()
+    ]
 
     try:
-        predictions, accuracy = run_ml_model(data_ml)
-        log_model_accuracy(
-            sheet,
-            "DecisionTreeClassifier",
-            round(accuracy * 100, 2),
-            datetime.now().strftime("%Y-%m-%d"),
-        )
-        log_ml_predictions(sheet, ticker, predictions, original_data_df=data_ml)
+        predictions, accuracy = run_ml_model(data_ml, extra_features=mtf_features)
+        result["predictions"] = predictions
+        result["ml_volume"] = data_ml[["Date", "Volume"]]
+        result["accuracy"] = accuracy
     except Exception as e:
         print(f"[ERROR] ML prediction failed for {ticker}: {e}")
-        accuracy = 0
+
+    return result
+
+
+def log_result(sheet, result, chart_renderer=None):
+    """Write one process_ticker() result to Google Sheets and queue its chart."""
+    ticker = result["ticker"]
+    trade_rows = result["trade_rows"]
+
+    if trade_rows:
+        try:
+            log_trade(sheet, trade_rows)
+            print(f"✅ Logged {len(trade_rows)} trades for {ticker}.")
+        except Exception as e:
+            print(f"[ERROR] Logging trades for {ticker} failed: {e}")
+
+    if chart_renderer is not None and result["chart"] is not None:
+        try:
+            chart_renderer.submit(ticker, *result["chart"])
+        except Exception as e:
+            print(f"[ERROR] Chart submission failed for {ticker}: {e}")
+
+    accuracy = result["accuracy"]
+    if result["predictions"] is not None:
+        try:
+            log_model_accuracy(
+                sheet,
+                "DecisionTreeClassifier",
+                round(accuracy * 100, 2),
+                datetime.now().strftime("%Y-%m-%d"),
+            )
+            log_ml_predictions(sheet, ticker, result["predictions"], original_data_df=result["ml_volume"])
+        except Exception as e:
+            print(f"[ERROR] ML prediction failed for {ticker}: {e}")
+            accuracy = 0
+
+    if not result["log_summary"]:
+        return
 
     try:
         accuracy_value = round(accuracy * 100, 2) if accuracy else 0.0
@@ -100,4 +194,30 @@ for ticker in TICKERS:
     except Exception as e:
         print(f"[ERROR] Summary log failed for {ticker}: {e}")
 
-print("\n🎯 All tickers processed.")
+
+def connect_sheet():
+    try:
+        return connect_to_gsheet(CREDENTIALS_FILE, SHEET_NAME)
+    except Exception as e:
+        print(f"[ERROR] Google Sheets connection failed: {e}")
+        sys.exit(1)
+
+
+def main():
+    sheet = connect_sheet()
+
+    with ChartRenderer() as chart_renderer:
+        for ticker in TICKERS:
+            result = process_ticker(ticker)
+            if result is not None:
+                log_result(sheet, result, chart_renderer)
+
+        print("\n🎯 All tickers processed.")
+
+        rendered = chart_renderer.close()
+        print(f"🖼️ Rendered {len(rendered)} chart(s).")
+
+
+if __name__ == "__main__":
+    # Guard keeps chart pool workers from re-running the scan on spawn platforms
+    main()
@@ -3,23 +3,25 @@ from sklearn.model_selection import train_test_split
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.metrics import accuracy_score
 
-def run_ml_model(df: pd.DataFrame):
+def run_ml_model(df: pd.DataFrame, extra_features=None):
     df = df.copy()
+    extra_features = list(extra_features or [])
 
     # Use indicator names consistent with your other modules
-    required_cols = ['RSI', 'MA20', 'MA50', 'Signal']
+    required_cols = ['RSI', 'MA20', 'MA50', 'Signal'] + extra_features
     for col in required_cols:
         if col not in df.columns:
             raise ValueError(f"[ERROR] Missing required column: {col}")
 
     # Map Signal to numeric label
     df['Signal_Label'] = df['Signal'].map({'BUY': 1, 'SELL': 0})
-    df = df.dropna(subset=['Signal_Label'])
+    # Higher-timeframe features are empty until enough coarse bars exist
+    df = df.dropna(subset=['Signal_Label'] + extra_features)
 
     if df.shape[0] < 10:
         raise ValueError("Not enough data for ML model (need at least 10 rows).")
 
-    X = df[['RSI', 'MA20', 'MA50']]
+    X = df[['RSI', 'MA20', 'MA50'] + extra_features]
     y = df['Signal_Label']
 
     X = X.reset_index(drop=True)
@@ -0,0 +1,259 @@
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import time
+from multiprocessing.connection import wait
+
+import config
+from data.resample import TimeframeCache
+from main import INTERVAL, TIMEFRAMES, connect_sheet, log_result, process_ticker
+from utils.charts import ChartRenderer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAX_RESTARTS = 1  # Crashes retried per ticker before it is skipped for the scan
+TICKER_TIMEOUT = 300  # Seconds a worker may spend on one ticker before it is killed
+POLL_SECONDS = 1.0
+
+
+def load_universe(path=None):
+    """
+    Load the tickers to scan.
+
+    Parameters:
+        path (str): Optional file with one ticker per line ('#' starts a comment);
+            falls back to config.STOCKS when not given
+
+    Returns:
+        list: Ticker symbols in file order, without duplicates
+    """
+    if path is None:
+        tickers = config.STOCKS
+    else:
+        with open(path) as f:
+            tickers = [line.split("#", 1)[0].strip() for line in f]
+    return list(dict.fromkeys(t for t in tickers if t))
+
+
+def assign_shards(tickers, num_shards):
+    """
+    Deal tickers round-robin in sorted order so every shard gets a share.
+
+    The same universe and shard count always give the same assignment, which
+    is all that is needed for a worker's cache to stay warm across scans.
+
+    Returns:
+        dict: {shard_id: [tickers]} for min(num_shards, len(tickers)) shards
+    """
+    ordered = sorted(tickers)
+    return {
+        shard_id: ordered[shard_id::num_shards]
+        for shard_id in range(min(num_shards, len(ordered)))
+    }
+
+
+def _shard_worker(shard_id, tasks, conn, process):
+    # The cache lives as long as the worker, so a shard's bars stay warm across scans
+    timeframe_cache = TimeframeCache(TIMEFRAMES, base_interval=INTERVAL)
+
+    # conn.send() writes straight to this worker's own pipe (no feeder thread),
+    # so everything sent before a crash reaches the parent intact
+    while True:
+        tickers = tasks.get()
+        if tickers is None:
+            break
+        for ticker in tickers:
+            # The worker's own start time, so the deadline does not depend on
+            # how quickly the parent gets round to reading this message
+            conn.send(("start", ticker, time.monotonic()))
+            try:
+                result = process(ticker, timeframe_cache)
+            except Exception as e:
+                logger.error(f"❌ Shard {shard_id}: {ticker} failed: {e}")
+                result = None
+            conn.send(("result", ticker, result))
+        conn.send(("done", None, None))
+    conn.close()
+
+
+class ShardedScanner:
+    """
+    Run the per-ticker pipeline across worker processes, one shard each.
+
+    Workers only fetch and compute; each streams results back over its own
+    pipe and the calling process performs every Google Sheets write and chart
+    submission. Workers are kept alive between scans.
+
+    Workers announce each ticker before starting it. If a worker dies, or
+    spends longer than ticker_timeout on one ticker, it is killed and respawned
+    for its unfinished tickers; the ticker it was on is retried max_restarts
+    times before being skipped, so one bad ticker cannot take down its shard.
+    """
+
+    def __init__(self, tickers, num_workers, max_restarts=MAX_RESTARTS,
+                 ticker_timeout=TICKER_TIMEOUT, process=process_ticker):
+        if num_workers < 1:
+            raise ValueError("[ERROR] num_workers must be at least 1")
+        self.shards = assign_shards(tickers, num_workers)
+        self.max_restarts = max_restarts
+        self.ticker_timeout = ticker_timeout
+        self.process = process
+        self._ctx = mp.get_context()
+        self._workers = {}
+
+    def _spawn(self, shard_id):
+        tasks = self._ctx.Queue()
+        reader, writer = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(
+            target=_shard_worker,
+            args=(shard_id, tasks, writer, self.process),
+            name=f"shard-{shard_id}",
+            daemon=True,
+        )
+        proc.start()
+        writer.close()  # Only the worker holds the write end, so its death reads as EOF
+        self._workers[shard_id] = (proc, tasks, reader)
+        logger.info(f"🚀 Started shard {shard_id} (pid {proc.pid})")
+
+    def _kill(self, shard_id):
+        proc, _, reader = self._workers.pop(shard_id)
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        reader.close()
+
+    def _dispatch(self, shard_id, tickers):
+        if shard_id in self._workers and not self._workers[shard_id][0].is_alive():
+            self._kill(shard_id)
+        if shard_id not in self._workers:
+            self._spawn(shard_id)
+        self._workers[shard_id][1].put(tickers)
+
+    def scan(self, sheet, chart_renderer=None):
+        """
+        Scan every shard once and log results as they arrive.
+
+        Returns:
+            list: Tickers skipped because their worker kept crashing or timing out on them
+        """
+        pending = {shard_id: list(tickers) for shard_id, tickers in self.shards.items()}
+        in_flight = {}
+        crashes = {}
+        failed = []
+
+        def recover(shard_id, reason):
+            logger.error(f"❌ Shard {shard_id} {reason}")
+            self._kill(shard_id)
+
+            # Blame the ticker the worker last announced; a crash between tickers
+            # counts against the shard itself so a worker that cannot start gives up
+            culprit = in_flight.pop(shard_id, (None, None))[0]
+            key = culprit if culprit is not None else shard_id
+            crashes[key] = crashes.get(key, 0) + 1
+            if crashes[key] > self.max_restarts:
+                dropped = [culprit] if culprit is not None else list(pending[shard_id])
+                failed.extend(dropped)
+                pending[shard_id] = [t for t in pending[shard_id] if t not in dropped]
+
+            if pending[shard_id]:
+                self._dispatch(shard_id, pending[shard_id])
+            else:
+                active.discard(shard_id)
+
+        def drain(shard_id):
+            # Read everything the worker has sent so far; stops early if it died
+            while shard_id in active:
+                reader = self._workers[shard_id][2]
+                if not reader.poll():
+                    return
+                try:
+                    kind, ticker, payload = reader.recv()
+                except Exception as e:
+                    # EOF, or a message cut short when the worker died mid-send
+                    recover(shard_id, f"exited while scanning ({type(e).__name__})")
+                    return
+
+                if kind == "start":
+                    in_flight[shard_id] = (ticker, payload)
+                elif kind == "result":
+                    in_flight.pop(shard_id, None)
+                    if ticker in pending[shard_id]:
+                        pending[shard_id].remove(ticker)
+                    if payload is not None:
+                        log_result(sheet, payload, chart_renderer)
+                else:
+                    active.discard(shard_id)
+
+        for shard_id, tickers in pending.items():
+            self._dispatch(shard_id, tickers)
+        active = set(pending)
+
+        while active:
+            readers = {self._workers[shard_id][2]: shard_id for shard_id in active}
+            for reader in wait(list(readers), timeout=POLL_SECONDS):
+                drain(readers[reader])
+
+            for shard_id in list(in_flight):
+                # A finished result may be queued behind slow Sheets writes
+                drain(shard_id)
+                if shard_id not in in_flight:
+                    continue
+                ticker, started = in_flight[shard_id]
+                if time.monotonic() - started > self.ticker_timeout:
+                    recover(shard_id, f"timed out after {self.ticker_timeout}s on {ticker}")
+
+        if failed:
+            logger.error(f"❌ Gave up on {len(failed)} ticker(s): {', '.join(failed)}")
+        return failed
+
+    def close(self):
+        """Stop all workers, terminating any that do not exit on their own."""
+        for proc, tasks, _ in self._workers.values():
+            if proc.is_alive():
+                tasks.put(None)
+        for shard_id in list(self._workers):
+            proc = self._workers[shard_id][0]
+            proc.join(timeout=10)
+            self._kill(shard_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded multi-process universe scan.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of shard worker processes (default: CPU count)")
+    parser.add_argument("--universe", help="File with one ticker per line (default: config.STOCKS)")
+    parser.add_argument("--every", type=float, default=0,
+                        help="Repeat the scan every N seconds; 0 runs once (default)")
+    parser.add_argument("--ticker-timeout", type=float, default=TICKER_TIMEOUT,
+                        help=f"Kill a worker stuck on one ticker for N seconds (default: {TICKER_TIMEOUT})")
+    args = parser.parse_args()
+
+    tickers = load_universe(args.universe)
+    sheet = connect_sheet()
+
+    num_workers = min(args.workers, len(tickers)) or 1
+    with ShardedScanner(tickers, num_workers, ticker_timeout=args.ticker_timeout) as scanner:
+        while True:
+            started = time.monotonic()
+            with ChartRenderer() as chart_renderer:
+                failed = scanner.scan(sheet, chart_renderer)
+                rendered = chart_renderer.close()
+
+            print(f"\n🎯 Scanned {len(tickers) - len(failed)}/{len(tickers)} tickers, "
+                  f"rendered {len(rendered)} chart(s).")
+
+            if args.every <= 0:
+                break
+            time.sleep(max(0.0, args.every - (time.monotonic() - started)))
+
+
+if __name__ == "__main__":
+    main()
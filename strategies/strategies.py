@@ -3,6 +3,21 @@ import logging
 
 logging.basicConfig(level=logging.INFO)
 
+def _rsi(close: pd.Series, period: int = 14) -> pd.Series:
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0.0)
+    loss = -delta.where(delta < 0, 0.0)
+    avg_gain = gain.rolling(window=period, min_periods=period).mean()
+    avg_loss = loss.rolling(window=period, min_periods=period).mean()
+    rs = avg_gain / avg_loss
+    rs = rs.replace([float('inf'), -float('inf')], 0).fillna(0)
+    return 100 - (100 / (1 + rs))
+
+def _macd(close: pd.Series, min_periods: int = 0) -> pd.Series:
+    short_ema = close.ewm(span=12, adjust=False, min_periods=min_periods).mean()
+    long_ema = close.ewm(span=26, adjust=False, min_periods=min_periods).mean()
+    return short_ema - long_ema
+
 def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     if 'Close' not in df.columns:
@@ -11,18 +26,8 @@ def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     df['MA20'] = df['Close'].rolling(window=20, min_periods=20).mean()
     df['MA50'] = df['Close'].rolling(window=50, min_periods=50).mean()
 
-    delta = df['Close'].diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-    avg_gain = gain.rolling(window=14, min_periods=14).mean()
-    avg_loss = loss.rolling(window=14, min_periods=14).mean()
-    rs = avg_gain / avg_loss
-    rs = rs.replace([float('inf'), -float('inf')], 0).fillna(0)
-    df['RSI'] = 100 - (100 / (1 + rs))
-
-    short_ema = df['Close'].ewm(span=12, adjust=False).mean()
-    long_ema = df['Close'].ewm(span=26, adjust=False).mean()
-    df['MACD'] = short_ema - long_ema
+    df['RSI'] = _rsi(df['Close'])
+    df['MACD'] = _macd(df['Close'])
 
     if 'Volume' not in df.columns:
         df['Volume'] = 0
@@ -31,7 +36,39 @@ def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     logging.info(f"MACD sample values:\n{df['MACD'].head()}")
     return df
 
-def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
+def add_timeframe_features(df: pd.DataFrame, timeframe_bars: dict) -> pd.DataFrame:
+    """
+    Attach higher-timeframe MACD to each base row as MACD_<tf>.
+
+    A row only sees higher-timeframe bars whose period has closed, so every
+    row (including the newest) uses completed bars and never prices from later
+    in the same week.
+    """
+    df = df.copy()
+    if 'Date' not in df.columns:
+        raise ValueError("[ERROR] 'Date' column missing for timeframe features")
+
+    df['Date'] = pd.to_datetime(df['Date'])
+    df = df.sort_values('Date', kind='stable').reset_index(drop=True)
+
+    for timeframe, bars in timeframe_bars.items():
+        if bars is None or bars.empty:
+            continue
+        features = pd.DataFrame({
+            'PeriodEnd': pd.to_datetime(bars['PeriodEnd']).reset_index(drop=True),
+            # NaN until the slow EMA has a full span of bars behind it
+            f'MACD_{timeframe}': _macd(bars['Close'], min_periods=26).reset_index(drop=True),
+        })
+        df = pd.merge_asof(df, features, left_on='Date', right_on='PeriodEnd', direction='backward')
+        df = df.drop(columns='PeriodEnd')
+
+    return df
+
+def timeframe_feature_columns(df: pd.DataFrame) -> list:
+    """Return the MACD_<tf> columns added by add_timeframe_features."""
+    return [col for col in df.columns if col.startswith('MACD_')]
+
+def generate_signals(df: pd.DataFrame, timeframe_bars: dict = None) -> pd.DataFrame:
     df = compute_indicators(df)
 
     if 'Date' not in df.columns:
@@ -40,6 +77,9 @@ def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
         else:
             df['Date'] = pd.date_range(start=0, periods=len(df), freq='D')
 
+    if timeframe_bars:
+        df = add_timeframe_features(df, timeframe_bars)
+
     df['Signal'] = ""
     num_rsi_below_30 = (df['RSI'] < 30).sum()
     num_rsi_above_70 = (df['RSI'] > 70).sum()
@@ -61,7 +101,11 @@ def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
     if 'Volume' in signals.columns:
         signals['Volume'] = signals['Volume'].fillna(0)
 
+    tf_cols = timeframe_feature_columns(signals)
+    for col in tf_cols:
+        signals[col] = signals[col].round(4)
+
     if signals.empty:
         logging.info("No signals generated.")
 
-    return signals[['Date', 'Close', 'RSI', 'MA20', 'MA50', 'MACD', 'Volume', 'Signal']]
+    return signals[['Date', 'Close', 'RSI', 'MA20', 'MA50', 'MACD', 'Volume', 'Signal'] + tf_cols]
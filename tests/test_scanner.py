@@ -0,0 +1,81 @@
+import os
+import time
+
+import pytest
+
+import scanner
+
+
+def fake_process(ticker, timeframe_cache):
+    if ticker == "CRASH.NS":
+        os._exit(1)
+    if ticker == "HANG.NS":
+        time.sleep(60)
+    return {"ticker": ticker}
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    results = []
+    monkeypatch.setattr(scanner, "log_result", lambda sheet, result, chart_renderer: results.append(result["ticker"]))
+    return results
+
+
+def run_scan(tickers, num_workers, **kwargs):
+    with scanner.ShardedScanner(tickers, num_workers, process=fake_process, **kwargs) as sharded:
+        return sharded.scan(sheet=None)
+
+
+def test_load_universe_reads_file_and_drops_comments_and_duplicates(tmp_path):
+    universe = tmp_path / "tickers.txt"
+    universe.write_text("TCS.NS\n# comment\n\nINFY.NS  # inline\nTCS.NS\n")
+    assert scanner.load_universe(str(universe)) == ["TCS.NS", "INFY.NS"]
+
+
+def test_load_universe_defaults_to_config():
+    assert scanner.load_universe() == list(dict.fromkeys(scanner.config.STOCKS))
+
+
+def test_assign_shards_uses_every_worker_and_is_stable():
+    tickers = ["RELIANCE.NS", "INFY.NS", "TCS.NS"]
+    shards = scanner.assign_shards(tickers, 2)
+    assert shards == {0: ["INFY.NS", "TCS.NS"], 1: ["RELIANCE.NS"]}
+    assert scanner.assign_shards(list(reversed(tickers)), 2) == shards
+    assert len(scanner.assign_shards(tickers, 3)) == 3
+    assert len(scanner.assign_shards(tickers, 5)) == 3
+
+
+def test_crashing_ticker_is_reported_and_others_are_logged(logged):
+    tickers = ["RELIANCE.NS", "CRASH.NS", "TCS.NS", "HDFCBANK.NS", "ITC.NS"]
+    failed = run_scan(tickers, 2)
+    assert failed == ["CRASH.NS"]
+    assert sorted(logged) == ["HDFCBANK.NS", "ITC.NS", "RELIANCE.NS", "TCS.NS"]
+
+
+def test_crash_is_retried_max_restarts_times(logged, monkeypatch):
+    spawned = []
+    spawn = scanner.ShardedScanner._spawn
+    monkeypatch.setattr(scanner.ShardedScanner, "_spawn", lambda self, shard_id: (spawned.append(shard_id), spawn(self, shard_id)))
+    failed = run_scan(["CRASH.NS", "TCS.NS"], 1, max_restarts=2)
+    assert failed == ["CRASH.NS"]
+    assert logged == ["TCS.NS"]
+    assert len(spawned) == 4  # First start, two retries, then a worker for the rest
+
+
+def test_hanging_ticker_times_out(logged):
+    failed = run_scan(["HANG.NS", "INFY.NS", "TCS.NS"], 2, ticker_timeout=1, max_restarts=0)
+    assert failed == ["HANG.NS"]
+    assert sorted(logged) == ["INFY.NS", "TCS.NS"]
+
+
+def test_finished_result_is_not_lost_behind_slow_logging(monkeypatch):
+    results = []
+
+    def slow_log(sheet, result, chart_renderer):
+        time.sleep(1.5)  # Longer than the timeout, like a slow Sheets write
+        results.append(result["ticker"])
+
+    monkeypatch.setattr(scanner, "log_result", slow_log)
+    failed = run_scan(["INFY.NS", "RELIANCE.NS", "TCS.NS"], 1, ticker_timeout=1)
+    assert failed == []
+    assert results == ["INFY.NS", "RELIANCE.NS", "TCS.NS"]
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CHART_DIR = "charts"
+MANIFEST_FILE = ".render_manifest.json"
+PRICE_COLS = ["Date", "Close", "MA20", "MA50", "RSI"]
+SIGNAL_COLS = ["Date", "Close", "Signal"]
+
+
+def chart_path(ticker, out_dir=CHART_DIR):
+    return os.path.join(out_dir, f"{ticker}_signals_chart.png")
+
+
+def content_hash(price_df: pd.DataFrame, signals_df: pd.DataFrame) -> str:
+    """
+    Fingerprint the data a chart is drawn from.
+
+    Parameters:
+        price_df (pd.DataFrame): Indicator data with 'Date', 'Close', 'MA20', 'MA50', 'RSI'
+        signals_df (pd.DataFrame): Signal rows with 'Date', 'Close', 'Signal'
+
+    Returns:
+        str: Hex digest that changes whenever any plotted value changes
+    """
+    digest = hashlib.sha256()
+    for frame in (price_df, signals_df):
+        digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+        digest.update(",".join(map(str, frame.columns)).encode())
+    return digest.hexdigest()
+
+
+def render_signal_chart(ticker, price_df, signals_df, out_path):
+    """
+    Draw price with MA20/MA50 and BUY/SELL markers above an RSI panel, and save it as PNG.
+
+    Runs inside pool workers, so matplotlib is imported here and pinned to the
+    non-interactive Agg backend.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    dates = pd.to_datetime(price_df["Date"])
+    signal_dates = pd.to_datetime(signals_df["Date"])
+
+    fig, (ax_price, ax_rsi) = plt.subplots(
+        2, 1, figsize=(12, 7), sharex=True, gridspec_kw={"height_ratios": [3, 1]}
+    )
+    try:
+        ax_price.plot(dates, price_df["Close"], label="Close", color="black", linewidth=1)
+        ax_price.plot(dates, price_df["MA20"], label="MA20", color="tab:blue", linewidth=1)
+        ax_price.plot(dates, price_df["MA50"], label="MA50", color="tab:orange", linewidth=1)
+
+        buys = (signals_df["Signal"] == "BUY").values
+        sells = (signals_df["Signal"] == "SELL").values
+        ax_price.scatter(signal_dates[buys], signals_df["Close"][buys], marker="^", color="green", label="BUY", zorder=3)
+        ax_price.scatter(signal_dates[sells], signals_df["Close"][sells], marker="v", color="red", label="SELL", zorder=3)
+        ax_price.set_title(f"{ticker} — Price, Moving Averages & Signals")
+        ax_price.set_ylabel("Price")
+        ax_price.legend(loc="upper left")
+        ax_price.grid(alpha=0.3)
+
+        ax_rsi.plot(dates, price_df["RSI"], color="tab:purple", linewidth=1)
+        ax_rsi.axhline(70, color="red", linestyle="--", linewidth=0.8)
+        ax_rsi.axhline(30, color="green", linestyle="--", linewidth=0.8)
+        ax_rsi.set_ylim(0, 100)
+        ax_rsi.set_ylabel("RSI")
+        ax_rsi.grid(alpha=0.3)
+
+        fig.tight_layout()
+        fig.savefig(out_path, dpi=100)
+    finally:
+        plt.close(fig)
+    return out_path
+
+
+class ChartRenderer:
+    """
+    Render signal charts in a process pool while the scan keeps running.
+
+    submit() returns immediately; tickers whose plotted data hashes the same as
+    at the last successful render (and whose PNG still exists) are skipped.
+    Call close() once the scan is done to wait for the pool and save the hashes.
+    """
+
+    def __init__(self, out_dir=CHART_DIR, max_workers=None):
+        self.out_dir = out_dir
+        self.max_workers = max_workers
+        self._manifest_path = os.path.join(out_dir, MANIFEST_FILE)
+        self._manifest = self._load_manifest()
+        self._pool = None
+        self._pending = {}
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self._manifest_path)
+
+    def submit(self, ticker, price_df, signals_df):
+        """
+        Queue a chart for a ticker unless its data is unchanged since the last render.
+
+        Returns:
+            bool: True if a render was queued, False if it was skipped
+        """
+        price_df = price_df[PRICE_COLS].reset_index(drop=True)
+        signals_df = signals_df[SIGNAL_COLS].reset_index(drop=True)
+        out_path = chart_path(ticker, self.out_dir)
+        digest = content_hash(price_df, signals_df)
+
+        if self._manifest.get(ticker) == digest and os.path.exists(out_path):
+            logger.info(f"⏭️ Chart for {ticker} unchanged, skipping render.")
+            return False
+
+        if self._pool is None:
+            os.makedirs(self.out_dir, exist_ok=True)
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        future = self._pool.submit(render_signal_chart, ticker, price_df, signals_df, out_path)
+        self._pending[ticker] = (future, digest)
+        return True
+
+    def close(self):
+        """
+        Wait for queued renders, record hashes for the ones that succeeded.
+
+        Safe to call more than once; the context manager calls it again on exit.
+
+        Returns:
+            dict: {ticker: chart path} for charts rendered in this run
+        """
+        rendered = {}
+        for ticker, (future, digest) in self._pending.items():
+            try:
+                rendered[ticker] = future.result()
+                self._manifest[ticker] = digest
+                logger.info(f"🖼️ Rendered chart for {ticker}: {rendered[ticker]}")
+            except Exception as e:
+                logger.error(f"❌ Chart render failed for {ticker}: {e}")
+        self._pending.clear()
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if rendered:
+            self._save_manifest()
+        return rendered
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()